@@ -85,6 +85,11 @@ enum Config {
         return "http://\(ip):5000"
     }
     
+    /// Upload images as multipart/form-data (opt-in via VM_MULTIPART_UPLOAD=true; defaults to base64 JSON)
+    static var vmMultipartUpload: Bool {
+        return getEnvVariable("VM_MULTIPART_UPLOAD")?.lowercased() == "true"
+    }
+    
     /// Check if VM API is configured
     static var isVMConfigured: Bool {
         return externalIP != nil
@@ -17,6 +17,8 @@ struct HomeView: View {
     @State private var editingDataset: PreprocessedDataset?
     @State private var editDescription = ""
     @State private var showingEditDialog = false
+    @State private var editErrorMessage = ""
+    @State private var showingEditError = false
     @State private var datasetToDelete: PreprocessedDataset?
     @State private var showingDeleteConfirmation = false
     @State private var selectedDataset: PreprocessedDataset?
@@ -286,20 +288,33 @@ struct HomeView: View {
                 Button("Save") {
                     if let dataset = editingDataset {
                         Task {
-                            try? await vmManager.updateDatasetDescription(
-                                id: dataset.id,
-                                description: editDescription
-                            )
+                            do {
+                                try await vmManager.updateDatasetDescription(
+                                    id: dataset.id,
+                                    description: editDescription
+                                )
+                            } catch {
+                                editErrorMessage = error.localizedDescription
+                                showingEditError = true
+                            }
                             editingDataset = nil
                         }
                     }
                 }
+                .disabled(!VMProcessingManager.isValidDescription(editDescription))
                 Button("Cancel", role: .cancel) {
                     editingDataset = nil
                 }
             } message: {
                 Text("Update the description for this preprocessed object")
             }
+            .alert("Update Failed", isPresented: $showingEditError) {
+                Button("OK") {
+                    editErrorMessage = ""
+                }
+            } message: {
+                Text(editErrorMessage)
+            }
             .alert("Delete Dataset", isPresented: $showingDeleteConfirmation) {
                 Button("Delete", role: .destructive) {
                     if let dataset = datasetToDelete {
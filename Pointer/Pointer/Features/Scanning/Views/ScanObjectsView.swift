@@ -224,7 +224,7 @@ struct ScanObjectsView: View {
                     .foregroundColor(.white).frame(width: 150).padding(.vertical, 16)
                     .background(
                         Group {
-                            if objectDescription.trimmingCharacters(in: .whitespaces).isEmpty {
+                            if !VMProcessingManager.isValidDescription(objectDescription) {
                                 Color.gray.opacity(0.5)
                             } else {
                                 LinearGradient(gradient: Gradient(colors: [Color.green, Color.cyan]), startPoint: .leading, endPoint: .trailing)
@@ -233,7 +233,7 @@ struct ScanObjectsView: View {
                     )
                     .cornerRadius(12)
                 }
-                .disabled(objectDescription.trimmingCharacters(in: .whitespaces).isEmpty)
+                .disabled(!VMProcessingManager.isValidDescription(objectDescription))
             }
         }
         .padding(.bottom, 30)
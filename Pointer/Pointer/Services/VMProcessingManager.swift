@@ -19,8 +19,22 @@ class VMProcessingManager: ObservableObject {
     private var fetchTask: Task<Void, Never>?
     private let urlSession: URLSession
     
+    /// HTTP cache for every response on the session, shared across manager instances so cacheable
+    /// responses (e.g. dataset images with ETag/Last-Modified) are revalidated instead of re-downloaded.
+    /// Sized for 720p dataset JPEGs (under 1 MB each, inside URLCache's ~5%-of-capacity entry limit
+    /// on both tiers); kept in its own directory so it does not share a store with URLCache.shared
+    private static let responseCache = URLCache(
+        memoryCapacity: 32 * 1024 * 1024,
+        diskCapacity: 100 * 1024 * 1024,
+        directory: FileManager.default.urls(for: .cachesDirectory, in: .userDomainMask)[0].appendingPathComponent("VMResponses")
+    )
+    
+    /// Longest object description the server accepts as a text prompt
+    static let maxDescriptionLength = 500
+    
     init() {
         let configuration = URLSessionConfiguration.default
+        configuration.urlCache = Self.responseCache
         configuration.timeoutIntervalForRequest = 30
         configuration.timeoutIntervalForResource = 60
         configuration.waitsForConnectivity = true
@@ -28,7 +42,7 @@ class VMProcessingManager: ObservableObject {
     }
     
     enum VMError: LocalizedError {
-        case notConfigured, noImages, invalidDescription, invalidResponse
+        case notConfigured, noImages, emptyDescription, descriptionTooLong, invalidResponse
         case connectionFailed(String), uploadFailed(String), processingFailed(String)
         
         var errorDescription: String? {
@@ -38,7 +52,8 @@ class VMProcessingManager: ObservableObject {
             case .uploadFailed(let msg): "Upload failed: \(msg)"
             case .processingFailed(let msg): "Processing failed: \(msg)"
             case .noImages: "No images to process"
-            case .invalidDescription: "Please provide a valid object description"
+            case .emptyDescription: "Please provide an object description"
+            case .descriptionTooLong: "Object description must be at most \(VMProcessingManager.maxDescriptionLength) characters"
             case .invalidResponse: "Invalid response from server"
             }
         }
@@ -46,34 +61,49 @@ class VMProcessingManager: ObservableObject {
     
     // MARK: - Public Methods
     
+    /// Whether the server will accept a description as a text prompt; used to gate submit buttons
+    static func isValidDescription(_ description: String) -> Bool {
+        descriptionError(description) == nil
+    }
+    
     /// Upload images to VM and trigger preprocessing via API
     func processImages(_ images: [UIImage], description: String) async throws -> String {
         guard !images.isEmpty else { throw VMError.noImages }
-        guard !description.trimmingCharacters(in: .whitespaces).isEmpty else { throw VMError.invalidDescription }
+        if let error = Self.descriptionError(description) { throw error }
         guard let apiURL = Config.vmApiURL else { throw VMError.notConfigured }
         
         return try await withProcessing("Preparing images...") {
             var request = URLRequest(url: URL(string: "\(apiURL)/preprocess")!)
             request.httpMethod = "POST"
-            request.setValue("application/json", forHTTPHeaderField: "Content-Type")
             request.timeoutInterval = 600
             
             await updateProgress("Encoding images...")
             
-            let imageDataArray = try images.enumerated().map { index, image -> [String: Any] in
+            let jpegDataArray = try images.enumerated().map { index, image -> Data in
                 guard let orientedImage = image.normalizedOrientation() else {
                     throw VMError.uploadFailed("Failed to normalize orientation for image \(index)")
                 }
                 guard let jpegData = orientedImage.jpegData(compressionQuality: 1.0) else {
                     throw VMError.uploadFailed("Failed to convert image \(index) to JPEG")
                 }
-                return ["index": index, "data": jpegData.base64EncodedString(), "format": "jpg"]
+                return jpegData
             }
             
-            request.httpBody = try JSONSerialization.data(withJSONObject: [
-                "description": description,
-                "images": imageDataArray
-            ])
+            if Config.vmMultipartUpload {
+                // Raw JPEG parts - no base64 inflation on the wire or decode pass on the server
+                let boundary = "Boundary-\(UUID().uuidString)"
+                request.setValue("multipart/form-data; boundary=\(boundary)", forHTTPHeaderField: "Content-Type")
+                request.httpBody = multipartBody(boundary: boundary, description: description, jpegDataArray: jpegDataArray)
+            } else {
+                // Legacy JSON body with base64-encoded images for older servers
+                request.setValue("application/json", forHTTPHeaderField: "Content-Type")
+                request.httpBody = try JSONSerialization.data(withJSONObject: [
+                    "description": description,
+                    "images": jpegDataArray.enumerated().map { index, jpegData in
+                        ["index": index, "data": jpegData.base64EncodedString(), "format": "jpg"]
+                    }
+                ])
+            }
             
             await updateProgress("Uploading to VM...")
             let responseDict = try await performRequest(request)
@@ -82,6 +112,11 @@ class VMProcessingManager: ObservableObject {
                 throw VMError.invalidResponse
             }
             
+            // Server answers 202 with a queued status and preprocesses in the background
+            if let status = responseDict["status"] as? String, status == "queued" || status == "running" {
+                try await waitForPreprocessing(apiURL: apiURL, datasetId: datasetId)
+            }
+            
             await saveDataset(PreprocessedDataset(id: datasetId, description: description, timestamp: Date(), imageCount: images.count))
             return datasetId
         }
@@ -169,6 +204,7 @@ class VMProcessingManager: ObservableObject {
     
     /// Update the description (text prompt) of a dataset
     func updateDatasetDescription(id datasetId: String, description: String) async throws {
+        if let error = Self.descriptionError(description) { throw error }
         guard let apiURL = Config.vmApiURL else { throw VMError.notConfigured }
         
         var request = URLRequest(url: URL(string: "\(apiURL)/dataset/\(datasetId)/text_prompt")!)
@@ -277,6 +313,96 @@ class VMProcessingManager: ObservableObject {
         return try await block()
     }
     
+    /// Poll the dataset endpoint until background preprocessing finishes
+    private func waitForPreprocessing(apiURL: String, datasetId: String) async throws {
+        // Status changes underneath us, so never answer a poll from the URL cache
+        let request = URLRequest(url: URL(string: "\(apiURL)/dataset/\(datasetId)")!, cachePolicy: .reloadIgnoringLocalCacheData)
+        let deadline = Date().addingTimeInterval(600)
+        
+        var lastPollError: Error?
+        
+        while Date() < deadline {
+            let data: Data
+            let httpResponse: HTTPURLResponse
+            do {
+                let (responseData, response) = try await urlSession.data(for: request)
+                guard let response = response as? HTTPURLResponse else { throw VMError.invalidResponse }
+                data = responseData
+                httpResponse = response
+            } catch let error as URLError {
+                // Upload was already accepted - ride out network failures until the deadline
+                lastPollError = error
+                try await Task.sleep(nanoseconds: 2_000_000_000)
+                continue
+            }
+            
+            switch httpResponse.statusCode {
+            case 200...299:
+                break
+            case 500...599:
+                // Server-side hiccup, retry
+                lastPollError = serverError(statusCode: httpResponse.statusCode, data: data)
+                try await Task.sleep(nanoseconds: 2_000_000_000)
+                continue
+            default:
+                // 4xx (e.g. dataset deleted) will not resolve by waiting
+                throw serverError(statusCode: httpResponse.statusCode, data: data)
+            }
+            
+            guard let responseDict = try JSONSerialization.jsonObject(with: data) as? [String: Any] else {
+                throw VMError.invalidResponse
+            }
+            
+            switch responseDict["status"] as? String {
+            case "completed":
+                return
+            case "queued", nil:
+                // Server already reported the job as queued, so a missing status means it is still pending
+                await updateProgress("Waiting for VM...")
+            case "running":
+                await updateProgress("Processing on VM...")
+            case "failed":
+                throw VMError.processingFailed(responseDict["error"] as? String ?? "Preprocessing failed")
+            case let status?:
+                throw VMError.processingFailed("Unexpected preprocessing status: \(status)")
+            }
+            
+            try await Task.sleep(nanoseconds: 2_000_000_000)
+        }
+        
+        if let error = lastPollError {
+            throw VMError.processingFailed("Timed out waiting for preprocessing: \(error.localizedDescription)")
+        }
+        throw VMError.processingFailed("Timed out waiting for preprocessing")
+    }
+    
+    /// Build a multipart/form-data body with the description field and one `images` part per JPEG
+    private func multipartBody(boundary: String, description: String, jpegDataArray: [Data]) -> Data {
+        var body = Data()
+        body.append(Data("--\(boundary)\r\n".utf8))
+        body.append(Data("Content-Disposition: form-data; name=\"description\"\r\n\r\n".utf8))
+        body.append(Data("\(description)\r\n".utf8))
+        
+        for (index, jpegData) in jpegDataArray.enumerated() {
+            body.append(Data("--\(boundary)\r\n".utf8))
+            body.append(Data("Content-Disposition: form-data; name=\"images\"; filename=\"\(String(format: "%06d", index))-color.jpg\"\r\n".utf8))
+            body.append(Data("Content-Type: image/jpeg\r\n\r\n".utf8))
+            body.append(jpegData)
+            body.append(Data("\r\n".utf8))
+        }
+        
+        body.append(Data("--\(boundary)--\r\n".utf8))
+        return body
+    }
+    
+    /// Error for a description the server would reject
+    /// (counts Unicode scalars to match the server's Python `len()`)
+    private static func descriptionError(_ description: String) -> VMError? {
+        if description.trimmingCharacters(in: .whitespacesAndNewlines).isEmpty { return .emptyDescription }
+        if description.unicodeScalars.count > maxDescriptionLength { return .descriptionTooLong }
+        return nil
+    }
+    
     /// Update progress message
     private func updateProgress(_ message: String) async {
         await MainActor.run { self.processingProgress = message }
@@ -291,11 +417,7 @@ class VMProcessingManager: ObservableObject {
         }
         
         guard (200...299).contains(httpResponse.statusCode) else {
-            if let errorDict = try? JSONSerialization.jsonObject(with: data) as? [String: Any],
-               let errorMessage = errorDict["error"] as? String {
-                throw VMError.processingFailed(errorMessage)
-            }
-            throw VMError.processingFailed("HTTP \(httpResponse.statusCode)")
+            throw serverError(statusCode: httpResponse.statusCode, data: data)
         }
         
         guard let responseDict = try JSONSerialization.jsonObject(with: data) as? [String: Any] else {
@@ -305,6 +427,15 @@ class VMProcessingManager: ObservableObject {
         return responseDict
     }
         
+    /// Build an error from a non-2xx response, preferring the server's `error` message
+    private func serverError(statusCode: Int, data: Data) -> VMError {
+        if let errorDict = try? JSONSerialization.jsonObject(with: data) as? [String: Any],
+           let errorMessage = errorDict["error"] as? String {
+            return VMError.processingFailed(errorMessage)
+        }
+        return VMError.processingFailed("HTTP \(statusCode)")
+    }
+    
     private func saveDataset(_ dataset: PreprocessedDataset) async {
         await MainActor.run {
             // Remove any existing entry with same ID